@@ -7,6 +7,8 @@ of its state in the terminal.
 # Standard library imports
 import sys
 import os
+from array import array
+from functools import lru_cache
 
 # Third-party imports
 import sdl2
@@ -20,7 +22,23 @@ JOYSTICK_INDEX = 0      # The joystick to use (0 is the first one found)
 NUM_AXES = 6            # Number of axes to monitor (Steam Deck has 6)
 NUM_BUTTONS = 20        # Number of buttons to monitor (Steam Deck has 19)
 REFRESH_RATE_HZ = 60    # Target refresh rate for the display
-REFRESH_DELAY_MS = 1000 // REFRESH_RATE_HZ # Calculate delay in milliseconds
+REFRESH_DELAY_MS = max(1, 1000 // REFRESH_RATE_HZ) # Delay in milliseconds (never 0 -> no busy loop)
+EVENT_BUFFER_SIZE = 32  # Max number of SDL events pulled from the queue per call
+AXIS_DEADZONE = 512     # Axis changes smaller than this do not trigger a redraw
+AXIS_EXACT_VALUES = (0, -32768, 32767)  # Rest and full travel -> always redrawn
+
+# SDL event types we never read. They are dropped by SDL before reaching the queue.
+IGNORED_EVENT_TYPES = (
+    sdl2.SDL_MOUSEMOTION, sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP, sdl2.SDL_MOUSEWHEEL,
+    sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP, sdl2.SDL_TEXTINPUT, sdl2.SDL_TEXTEDITING,
+    sdl2.SDL_JOYHATMOTION, sdl2.SDL_JOYBALLMOTION,
+    sdl2.SDL_CONTROLLERAXISMOTION, sdl2.SDL_CONTROLLERBUTTONDOWN, sdl2.SDL_CONTROLLERBUTTONUP,
+    sdl2.SDL_CONTROLLERSENSORUPDATE,
+    sdl2.SDL_WINDOWEVENT, sdl2.SDL_SYSWMEVENT,
+    sdl2.SDL_FINGERDOWN, sdl2.SDL_FINGERUP, sdl2.SDL_FINGERMOTION,
+    sdl2.SDL_DOLLARGESTURE, sdl2.SDL_DOLLARRECORD, sdl2.SDL_MULTIGESTURE,
+    sdl2.SDL_DROPFILE,
+)
 
 # lectura y salida
 REFRESH_RATE_MS = 16  # 60Hz frecuencia aprox
@@ -71,81 +89,158 @@ def init_joystick(joystick_index):
     # I return the joystick I conencted to
     return joystick
 
-def poll_joystick_events(event, axis_values, button_values):
-    # Process pending SDL events and stores them in event
-    while sdl2.SDL_PollEvent(event) != 0:
-
-        # joystick and triggers
-        if event.type == sdl2.SDL_JOYAXISMOTION:
-            # Check if we are tracking this axis
-            if event.jaxis.axis in axis_values:
-                axis_values[event.jaxis.axis] = event.jaxis.value
-            # Uncomment for debugging:
-            #print(f"Axis {event.jaxis.axis} updated: {value}")
-
-        # D-pad and buttons
-        elif event.type in (sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP):
-            if event.jbutton.button in button_values:
-                button_values[event.jbutton.button] = event.jbutton.state
-            # Uncomment for debugging:
-            #print(f"Button {event.jbutton.button} state: {value}")
-
-        # Check for Quit event
-        elif event.type == sdl2.SDL_QUIT:
-            # Quit with error
-            sys.exit(0)
+def poll_joystick_events(events, axis_values, button_values, reported_axis_values):
+    """
+    Processes all pending SDL events and updates the axis and button states
+
+    Args:
+        events (sdl2.SDL_Event array): Buffer the events are read into. It is
+            allocated once in main() and reused every frame.
+        axis_values (array): Current value of each axis, indexed by axis ID
+        button_values (bytearray): Current state (0 or 1) of each button, indexed by button ID
+        reported_axis_values (array): Axis values the last time they were reported
+            as changed, used as the dead-zone reference
+
+    Returns:
+        bool: True if a button changed or an axis moved past the dead-zone, False otherwise.
+
+    Raises:
+        SystemExit: If a quit event is received.
+    """
+    changed = False
+
+    # Save the sdl2 functions/constants used for every event in local variables
+    # -> python does not have to look them up in the sdl2 module each time
+    peep_events = sdl2.SDL_PeepEvents
+    JAXIS = sdl2.SDL_JOYAXISMOTION
+    JBUTTON_DOWN = sdl2.SDL_JOYBUTTONDOWN
+    JBUTTON_UP = sdl2.SDL_JOYBUTTONUP
+    QUIT = sdl2.SDL_QUIT
+
+    # Run the SDL event pump once for this frame
+    sdl2.SDL_PumpEvents()
+
+    # Pull pending joystick events in batches and stores them in events
+    # (sdl2 only returns types from SDL_JOYAXISMOTION to SDL_JOYBUTTONUP)
+    count = peep_events(events, EVENT_BUFFER_SIZE, sdl2.SDL_GETEVENT, JAXIS, JBUTTON_UP)
+    while count > 0:
+        for event in events[:count]:
+            event_type = event.type
+
+            # joystick and triggers
+            if event_type == JAXIS:
+                # Check if we are tracking this axis
+                axis = event.jaxis.axis
+                if axis < len(axis_values):
+                    value = event.jaxis.value
+                    # Always save the value -> axis_values is never stale
+                    axis_values[axis] = value
+                    # Small changes are noise -> only report moves past the dead-zone
+                    # (or landing on rest / full travel)
+                    reported = reported_axis_values[axis]
+                    if value != reported and (abs(value - reported) >= AXIS_DEADZONE
+                                              or value in AXIS_EXACT_VALUES):
+                        reported_axis_values[axis] = value
+                        changed = True
+                # Uncomment for debugging:
+                #print(f"Axis {event.jaxis.axis} updated: {value}")
+
+            # D-pad and buttons
+            elif event_type == JBUTTON_DOWN or event_type == JBUTTON_UP:
+                button = event.jbutton.button
+                if button < len(button_values) and button_values[button] != event.jbutton.state:
+                    button_values[button] = event.jbutton.state
+                    changed = True
+                # Uncomment for debugging:
+                #print(f"Button {event.jbutton.button} state: {value}")
+
+        # Get the next batch, if any
+        count = peep_events(events, EVENT_BUFFER_SIZE, sdl2.SDL_GETEVENT, JAXIS, JBUTTON_UP)
+
+    # Check for Quit event
+    if peep_events(events, EVENT_BUFFER_SIZE, sdl2.SDL_GETEVENT, QUIT, QUIT) > 0:
+        # Quit with error
+        sys.exit(0)
+
+    # Throw away every other event type left in the queue -> nobody reads them
+    sdl2.SDL_FlushEvents(QUIT + 1, JAXIS - 1)
+    sdl2.SDL_FlushEvents(JBUTTON_UP + 1, sdl2.SDL_LASTEVENT)
+
+    return changed
 
 def display_dashboard(buttons, axes):
     """
     Render one frame of the joystick dashboard, overwriting the previous one
     """
 
-    # clear the whole terminal
-    os.system('clear' if os.name != 'nt' else 'cls')
-
-    print("--- SIMPLE JOYSTICK DASHBOARD --- (Press Ctrl+C to quit)")
-    print()
+    # cursor home + clear screen (ANSI) -> no 'clear' process launched per frame
+    lines = ["\x1b[H\x1b[J--- SIMPLE JOYSTICK DASHBOARD --- (Press Ctrl+C to quit)", ""]
 
     # Display Button States
-    print('--- BUTTONS ---')
-    for bid, val in buttons.items():
+    lines.append('--- BUTTONS ---')
+    for bid, val in enumerate(buttons):
         # The :2 formats the number to take up 2 spaces for alignment
-        print(f'Button {bid:2}: {"Pressed" if val else "Released"}')
+        lines.append(f'Button {bid:2}: {"Pressed" if val else "Released"}')
 
     # Display Axis States
-    print('\n--- AXES ---')
-    for aid, val in axes.items():
+    lines.append('\n--- AXES ---')
+    for aid, val in enumerate(axes):
         # The :6 formats the number to take up 6 spaces for alignment
-        print(f'Axis   {aid:2}: {val:+6d}')
+        lines.append(f'Axis   {aid:2}: {val:+6d}')
 
-def generate_dashboard(buttons, axes):
+    # write the whole frame at once
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+@lru_cache(maxsize=256)
+def button_panel(button_states):
     """
-    Generates a rich layout object to be displayed by Live.
-    This function NO LONGER prints to the screen. It just builds the layout.
+    Builds the buttons panel. Cached -> the same states reuse the same panel
+
+    Args:
+        button_states (tuple): State of each button, indexed by button ID
     """
     # Create a table for buttons
     button_table = Table(title="Buttons", expand=True)
     button_table.add_column("ID", justify="right", style="cyan")
     button_table.add_column("State", style="magenta")
 
-    for bid, val in buttons.items():
+    for bid, val in enumerate(button_states):
         state = "[bold green]Pressed[/]" if val else "[red]Released[/]"
         button_table.add_row(str(bid), state)
 
+    return Panel(button_table, title="[bold cyan]Buttons[/]")
+
+@lru_cache(maxsize=256)
+def axis_panel(axis_states):
+    """
+    Builds the axes panel. Cached -> the same values reuse the same panel
+
+    Args:
+        axis_states (tuple): Value of each axis, indexed by axis ID
+    """
     # Create a table for axes
     axis_table = Table(title="Axes", expand=True)
     axis_table.add_column("ID", justify="right", style="cyan")
     axis_table.add_column("Value", justify="right", style="magenta")
 
-    for aid, val in axes.items():
+    for aid, val in enumerate(axis_states):
         # Style positive/negative values differently
         color = "green" if val > 1000 else "red" if val < -1000 else "white"
         axis_table.add_row(str(aid), f"[{color}]{val:+6d}[/]")
-    
+
+    return Panel(axis_table, title="[bold cyan]Axes[/]")
+
+def generate_dashboard(buttons, axes):
+    """
+    Generates a rich layout object to be displayed by Live.
+    This function NO LONGER prints to the screen. It just builds the layout.
+    """
     # Create a layout with two columns for our tables
+    # (panels come from the cache when their values did not change)
     dashboard_columns = Columns([
-        Panel(button_table, title="[bold cyan]Buttons[/]"),
-        Panel(axis_table, title="[bold cyan]Axes[/]")
+        button_panel(tuple(buttons)),
+        axis_panel(tuple(axes))
     ])
     return dashboard_columns
 
@@ -163,26 +258,49 @@ def main():
         # this makes sdl2 to generate events -> for the event loop I created
         sdl2.SDL_JoystickEventState(sdl2.SDL_ENABLE)
 
-        # create an sdl_event objet/instance -> read data will be stored
-        event = sdl2.SDL_Event()
+        # Only axis, button and quit events are used -> tell sdl2 to drop the rest
+        for event_type in IGNORED_EVENT_TYPES:
+            sdl2.SDL_EventState(event_type, sdl2.SDL_IGNORE)
 
-        # Dictionaries to hold state for axes and buttons
-        axis_values = {i: 0 for i in range(NUM_AXES)}
-        button_values = {i: 0 for i in range(NUM_BUTTONS)}
+        # create a buffer of sdl_event objets/instances -> read data will be stored
+        events = (sdl2.SDL_Event * EVENT_BUFFER_SIZE)()
+
+        # Arrays to hold state for axes and buttons (the index is the SDL ID)
+        axis_values = array('h', [0] * NUM_AXES)   # int16, like SDL axis values
+        reported_axis_values = array('h', [0] * NUM_AXES)  # dead-zone reference
+        button_values = bytearray(NUM_BUTTONS)     # 0 = released, 1 = pressed
 
         with Live(generate_dashboard(button_values, axis_values), screen=True, vertical_overflow="visible") as live:
+            # Time (sdl ticks, ms) when the next frame has to be drawn
+            next_frame = sdl2.SDL_GetTicks() + REFRESH_DELAY_MS
+            changed = False
+
             # Main loop
             while True:
-                # First, update the state from any new events
-                poll_joystick_events(event, axis_values, button_values)
-
-                # Now, display the complete, updated state
-                #display_dashboard(button_values, axis_values)
-                # Update the live display with a newly generated dashboard
-                live.update(generate_dashboard(button_values, axis_values))
-
-                # Wait a moment before the next refresh
-                sdl2.SDL_Delay(REFRESH_DELAY_MS)
+                # Sleep until an event arrives or the next frame is due
+                # passing None -> the event stays in the queue for poll_joystick_events
+                timeout = next_frame - sdl2.SDL_GetTicks()
+                if timeout <= 0 or sdl2.SDL_WaitEventTimeout(None, timeout):
+                    # First, update the state from any new events
+                    if poll_joystick_events(events, axis_values, button_values, reported_axis_values):
+                        changed = True
+
+                # Not time to draw yet -> keep reading input
+                if sdl2.SDL_GetTicks() < next_frame:
+                    continue
+
+                # Now, display the complete, updated state (only if it changed)
+                if changed:
+                    #display_dashboard(button_values, axis_values)
+                    # Update the live display with a newly generated dashboard
+                    live.update(generate_dashboard(button_values, axis_values))
+                    changed = False
+
+                # Schedule the next frame (if drawing took too long, start again from now)
+                now = sdl2.SDL_GetTicks()
+                next_frame += REFRESH_DELAY_MS
+                if next_frame < now:
+                    next_frame = now + REFRESH_DELAY_MS
     
     # Handle graceful shutdown on Ctrl+C
     except KeyboardInterrupt:
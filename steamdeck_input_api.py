@@ -10,11 +10,12 @@ reusable for other developers.
 
 import sys
 import os
+import ctypes
+import curses
+import struct
+from array import array
+from collections.abc import Sequence
 import sdl2
-from rich.live import Live
-from rich.table import Table
-from rich.columns import Columns
-from rich.panel import Panel
 
 # --- Configuration Constants ---
 # Note: These are common values for a Steam Deck. Adjust for your controller.
@@ -22,12 +23,78 @@ JOYSTICK_INDEX = 0          # The joystick to use (0 is the first one found)
 NUM_AXES_TO_TRACK = 6       # Number of axes to monitor (Steam Deck has 6)
 NUM_BUTTONS_TO_TRACK = 20   # Number of buttons to monitor (covers back buttons)
 REFRESH_RATE_HZ = 60        # Target refresh rate for the display
-REFRESH_DELAY_SEC = int(1 / REFRESH_RATE_HZ) # Calculate delay in seconds
+REFRESH_DELAY_MS = max(1, 1000 // REFRESH_RATE_HZ) # Delay in milliseconds (never 0 -> no busy loop)
+EVENT_BUFFER_SIZE = 32      # Max number of SDL events pulled from the queue per call
+PANEL_WIDTH = 24            # Screen columns used by each dashboard panel
+VALUE_WIDTH = 8             # Screen columns reserved for each value cell
+AXIS_DEADZONE = 512         # Axis changes smaller than this do not mark the state as changed
+AXIS_EXACT_VALUES = (0, -32768, 32767) # Rest and full travel: always reported, even if close
+
+# Bits of the change mask returned by Joystick.state_changed(), one per control group
+GROUP_FACE_BUTTONS = 1 << 0
+GROUP_DPAD = 1 << 1
+GROUP_SHOULDERS = 1 << 2
+GROUP_JOYSTICKS = 1 << 3
+GROUP_BACK_BUTTONS = 1 << 4
+GROUP_OTHER = 1 << 5        # Tracked IDs that are not part of any group
+
+# Layout of the SDL event fields read by Joystick.update, so they can be read
+# from the raw event buffer with struct instead of ctypes field access.
+EVENT_SIZE = ctypes.sizeof(sdl2.SDL_Event)  # Stride between events in the buffer
+EVENT_TYPE = struct.Struct("=I")            # SDL_Event.type (Uint32)
+JOY_FIELDS_OFFSET = 12                      # After type, timestamp and which
+JOY_AXIS_FIELDS = struct.Struct("=Bxxxh")   # SDL_JoyAxisEvent.axis (Uint8), .value (Sint16)
+JOY_BUTTON_FIELDS = struct.Struct("=BB")    # SDL_JoyButtonEvent.button, .state (Uint8)
+
+# SDL event types we never read. They are dropped by SDL before reaching the queue.
+IGNORED_EVENT_TYPES = (
+    sdl2.SDL_MOUSEMOTION, sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP, sdl2.SDL_MOUSEWHEEL,
+    sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP, sdl2.SDL_TEXTINPUT, sdl2.SDL_TEXTEDITING,
+    sdl2.SDL_JOYHATMOTION, sdl2.SDL_JOYBALLMOTION,
+    sdl2.SDL_CONTROLLERAXISMOTION, sdl2.SDL_CONTROLLERBUTTONDOWN, sdl2.SDL_CONTROLLERBUTTONUP,
+    sdl2.SDL_CONTROLLERSENSORUPDATE,
+    sdl2.SDL_WINDOWEVENT, sdl2.SDL_SYSWMEVENT,
+    sdl2.SDL_FINGERDOWN, sdl2.SDL_FINGERUP, sdl2.SDL_FINGERMOTION,
+    sdl2.SDL_DOLLARGESTURE, sdl2.SDL_DOLLARRECORD, sdl2.SDL_MULTIGESTURE,
+    sdl2.SDL_DROPFILE,
+)
 
 # Check if the script is run with sudo
 if os.geteuid() != 0:
     print("Error: This script must be run as root. Please use 'sudo'.")
     sys.exit(1)
+
+class StateView(Sequence):
+    """
+    A live, read-only view of one of the Joystick state arrays.
+
+    It indexes, iterates and prints like a list of the current values, but
+    copies nothing, and it does not lock the array against resizing the
+    way a memoryview would.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._data[index])
+        return self._data[index]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def items(self):
+        """Returns (ID, value) pairs, like the old dict-based state."""
+        return enumerate(self._data)
+
+    def __repr__(self):
+        return repr(list(self._data))
     
 class Joystick:
     """A class to manage and read data from an SDL2 joystick."""
@@ -45,9 +112,48 @@ class Joystick:
         self._initialize_sdl()
         self._open_joystick(index)
 
-        # Master state dictionaries that hold the real-time data
-        self.axis_values = {i: 0 for i in range(num_axes)}
-        self.button_values = {i: 0 for i in range(num_buttons)}
+        # Master state arrays that hold the real-time data, indexed by SDL ID
+        self.axis_values = array('h', [0] * num_axes)     # int16, like SDL axis values
+        self.button_values = bytearray(num_buttons)        # 0 = released, 1 = pressed
+
+        # Axis values as of the last time they marked the state dirty (dead-zone reference)
+        self._axis_reported = array('h', [0] * num_axes)
+
+        # Read-only views of the state arrays handed out by full_state (no copies)
+        self._axis_view = StateView(self.axis_values)
+        self._button_view = StateView(self.button_values)
+
+        # Per-group state returned by the getter properties. update() keeps
+        # these in sync, so reading a property does not build a new dict.
+        self._face = {"A": 0, "B": 0, "X": 0, "Y": 0}
+        self._dpad = {"Up": 0, "Down": 0, "Left": 0, "Right": 0}
+        self._shoulders = {"L1": 0, "R1": 0, "L2 Axis": 0, "R2 Axis": 0}
+        self._sticks = {"LX": 0, "LY": 0, "RX": 0, "RY": 0, "L3": 0, "R3": 0}
+        self._back = {"L4": 0, "R4": 0, "L5": 0, "R5": 0}
+
+        # SDL ID -> (group dict, key, group bit) for every ID shown in a group
+        face, dpad, shoulders, sticks, back = self._face, self._dpad, self._shoulders, self._sticks, self._back
+        self._button_slots = {
+            0: (face, "A", GROUP_FACE_BUTTONS), 1: (face, "B", GROUP_FACE_BUTTONS),
+            2: (face, "X", GROUP_FACE_BUTTONS), 3: (face, "Y", GROUP_FACE_BUTTONS),
+            7: (sticks, "L3", GROUP_JOYSTICKS), 8: (sticks, "R3", GROUP_JOYSTICKS),
+            9: (shoulders, "L1", GROUP_SHOULDERS), 10: (shoulders, "R1", GROUP_SHOULDERS),
+            11: (dpad, "Up", GROUP_DPAD), 12: (dpad, "Down", GROUP_DPAD),
+            13: (dpad, "Left", GROUP_DPAD), 14: (dpad, "Right", GROUP_DPAD),
+            16: (back, "R4", GROUP_BACK_BUTTONS), 17: (back, "L4", GROUP_BACK_BUTTONS),
+            18: (back, "R5", GROUP_BACK_BUTTONS), 19: (back, "L5", GROUP_BACK_BUTTONS),
+        }
+        self._axis_slots = {
+            0: (sticks, "LX", GROUP_JOYSTICKS), 1: (sticks, "LY", GROUP_JOYSTICKS),
+            2: (sticks, "RX", GROUP_JOYSTICKS), 3: (sticks, "RY", GROUP_JOYSTICKS),
+            4: (shoulders, "L2 Axis", GROUP_SHOULDERS), 5: (shoulders, "R2 Axis", GROUP_SHOULDERS),
+        }
+
+        # Pre-allocated buffer that SDL_PeepEvents fills with pending events
+        self._events = (sdl2.SDL_Event * EVENT_BUFFER_SIZE)()
+
+        # GROUP_* bits of the groups changed by update(), cleared by state_changed()
+        self._dirty = 0
 
     def _initialize_sdl(self):
         """Initializes the SDL joystick subsystem."""
@@ -64,34 +170,116 @@ class Joystick:
             raise RuntimeError(f"Failed to open joystick {index}: {sdl2.SDL_GetError().decode()}")
 
         sdl2.SDL_JoystickEventState(sdl2.SDL_ENABLE)
+        for event_type in IGNORED_EVENT_TYPES:
+            sdl2.SDL_EventState(event_type, sdl2.SDL_IGNORE)
         print(f"Opened: {sdl2.SDL_JoystickName(self._joystick).decode()}")
 
-    def update(self):
+    def update(self, timeout_ms=0):
         """
         This is the core polling method. It must be called once per frame.
         It processes all pending SDL events and updates the internal state.
+        Events are read into the buffer allocated in __init__, so no SDL_Event
+        is created per call.
+
+        Args:
+            timeout_ms (int): If greater than 0, block for up to this many
+                milliseconds waiting for an event before processing the queue.
+                Returns as soon as input arrives.
 
         Returns:
             bool: False if a quit event was received, True otherwise.
         """
-        event = sdl2.SDL_Event()
-        # Process pending SDL events and stores them in event
-        while sdl2.SDL_PollEvent(event) != 0:
-            # joystick and triggers
-            if event.type == sdl2.SDL_JOYAXISMOTION:
-                if event.jaxis.axis in self.axis_values:
-                    self.axis_values[event.jaxis.axis] = event.jaxis.value
-            # D-pad and buttons
-            elif event.type in (sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP):
-                if event.jbutton.button in self.button_values:
-                    self.button_values[event.jbutton.button] = event.jbutton.state
-            # Check for Quit event
-            elif event.type == sdl2.SDL_QUIT:
-                # If the window is closed, we should exit gracefully.
-                return False
-        return True
+        axis_values = self.axis_values
+        button_values = self.button_values
+        num_axes = len(axis_values)
+        num_buttons = len(button_values)
+        events = self._events
+        axis_reported = self._axis_reported
+        axis_slots = self._axis_slots
+        button_slots = self._button_slots
+
+        # Bind the SDL functions and constants used per event to locals
+        peep_events = sdl2.SDL_PeepEvents
+        GETEVENT = sdl2.SDL_GETEVENT
+        JAXIS = sdl2.SDL_JOYAXISMOTION
+        JBUTTON_DOWN, JBUTTON_UP = sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP
+        QUIT = sdl2.SDL_QUIT
+        read_type = EVENT_TYPE.unpack_from
+        read_axis = JOY_AXIS_FIELDS.unpack_from
+        read_button = JOY_BUTTON_FIELDS.unpack_from
+
+        # Sleep until an event is queued (NULL event -> SDL leaves it in the queue)
+        if timeout_ms > 0 and not sdl2.SDL_WaitEventTimeout(None, timeout_ms):
+            return True
+
+        dirty = 0
+
+        # Pump once, then drain the joystick events in batches. SDL filters by
+        # type range, so only axis/button (and ignored ball/hat) events come back.
+        sdl2.SDL_PumpEvents()
+        count = peep_events(events, EVENT_BUFFER_SIZE, GETEVENT, JAXIS, JBUTTON_UP)
+        while count > 0:
+            # Read the fields straight from the raw buffer, one event every EVENT_SIZE bytes
+            for offset in range(0, count * EVENT_SIZE, EVENT_SIZE):
+                event_type, = read_type(events, offset)
+                # joystick and triggers
+                if event_type == JAXIS:
+                    axis, value = read_axis(events, offset + JOY_FIELDS_OFFSET)
+                    if axis < num_axes:
+                        # Always store the value, so the state is never stale
+                        axis_values[axis] = value
+                        slot = axis_slots.get(axis)
+                        if slot is not None:
+                            slot[0][slot[1]] = value
+
+                        # Jitter below the dead-zone does not mark the state as changed
+                        reported = axis_reported[axis]
+                        if value != reported and (abs(value - reported) >= AXIS_DEADZONE
+                                                  or value in AXIS_EXACT_VALUES):
+                            axis_reported[axis] = value
+                            dirty |= GROUP_OTHER if slot is None else slot[2]
+                # D-pad and buttons
+                elif event_type == JBUTTON_DOWN or event_type == JBUTTON_UP:
+                    button, state = read_button(events, offset + JOY_FIELDS_OFFSET)
+                    if button < num_buttons:
+                        if button_values[button] != state:
+                            button_values[button] = state
+                            slot = button_slots.get(button)
+                            if slot is None:
+                                dirty |= GROUP_OTHER
+                            else:
+                                slot[0][slot[1]] = state
+                                dirty |= slot[2]
+            count = peep_events(events, EVENT_BUFFER_SIZE, GETEVENT, JAXIS, JBUTTON_UP)
+        self._dirty |= dirty
+
+        # Check for Quit event
+        quit_requested = peep_events(events, EVENT_BUFFER_SIZE, GETEVENT, QUIT, QUIT) > 0
+
+        # Discard any other event type still queued (e.g. device added/removed)
+        # so the queue cannot fill up with events nobody reads
+        sdl2.SDL_FlushEvents(QUIT + 1, JAXIS - 1)
+        sdl2.SDL_FlushEvents(JBUTTON_UP + 1, sdl2.SDL_LASTEVENT)
+
+        # If the window is closed, we should exit gracefully.
+        return not quit_requested
+
+    def state_changed(self):
+        """
+        Reports which control groups changed since the last call.
+        Reading the mask clears it.
+
+        Returns:
+            int: A mask of GROUP_* bits, 0 if nothing changed. It can be used
+                 as a bool when only "did anything change" matters.
+        """
+        dirty = self._dirty
+        self._dirty = 0
+        return dirty
 
     # --- Getter Methods for Developers ---
+    # The group dicts below are updated in place by update().
+    # Use dict(...) on them if you need to keep a snapshot.
 
     @property
     def dpad_state(self):
@@ -113,13 +301,7 @@ class Joystick:
                 }
                 ```
         """
-        dpad_dict = {
-            "Up": self.button_values.get(11, 0),
-            "Down": self.button_values.get(12, 0),
-            "Left": self.button_values.get(13, 0),
-            "Right": self.button_values.get(14, 0),
-        }
-        return dpad_dict
+        return self._dpad
 
     @property
     def face_buttons(self):
@@ -137,13 +319,7 @@ class Joystick:
                 }
                 ```
         """
-        face_buttons_dict = {
-            "A": self.button_values.get(0, 0),
-            "B": self.button_values.get(1, 0),
-            "X": self.button_values.get(2, 0),
-            "Y": self.button_values.get(3, 0),
-        }
-        return face_buttons_dict
+        return self._face
 
     @property
     def shoulder_state(self):
@@ -163,13 +339,7 @@ class Joystick:
                   }
                   ```
         """
-        shoulder_dict = {
-            "L1": self.button_values.get(9, 0),
-            "R1": self.button_values.get(10, 0),
-            "L2 Axis": self.axis_values.get(4, 0),
-            "R2 Axis": self.axis_values.get(5, 0),
-        }
-        return shoulder_dict
+        return self._shoulders
 
     @property
     def joystick_state(self):
@@ -190,15 +360,7 @@ class Joystick:
                   }
                   ```
         """
-        joystick_dict = {
-            "LX": self.axis_values.get(0, 0),
-            "LY": self.axis_values.get(1, 0),
-            "RX": self.axis_values.get(2, 0),
-            "RY": self.axis_values.get(3, 0),
-            "L3": self.button_values.get(7, 0),
-            "R3": self.button_values.get(8, 0),
-        }
-        return joystick_dict
+        return self._sticks
 
     @property
     def back_buttons(self):
@@ -217,33 +379,32 @@ class Joystick:
                   }
                   ```
         """
-        back_buttons_dict = {
-            "L4": self.button_values.get(17, 0),
-            "R4": self.button_values.get(16, 0),
-            "L5": self.button_values.get(19, 0),
-            "R5": self.button_values.get(18, 0),
-        }
-        return back_buttons_dict
+        return self._back
 
     @property
     def full_state(self):
         """
-        Returns a complete snapshot of all tracked axes and buttons.
+        Returns a live, read-only view of all tracked axes and buttons.
+
+        Note:
+            No data is copied. The views always show the current state, so
+            use `list(...)` on them if you need a snapshot of one frame.
 
         Returns:
             dict: A dictionary containing two keys, 'axes' and 'buttons',
-                  whose values are dictionaries of the raw states.
+                  whose values are read-only StateViews of the raw states
+                  indexed by ID. They print like lists and support `.items()`.
                   Example:
                   ```
                   {
-                      "axes": {0: -256, 1: 12040, ...},
-                      "buttons": {0: 1, 1: 0, ...}
+                      "axes": [-256, 12040, ...],
+                      "buttons": [1, 0, ...]
                   }
                   ```
         """
         full_state_dict = {
-            "axes": self.axis_values.copy(),
-            "buttons": self.button_values.copy(),
+            "axes": self._axis_view,
+            "buttons": self._button_view,
         }
         return full_state_dict
 
@@ -255,35 +416,217 @@ class Joystick:
         sdl2.SDL_Quit()
         print("Joystick closed and SDL resources released.")
 
-def generate_dashboard_layout(joystick):
+class Dashboard:
     """
-    Generates a rich layout object to be displayed by Live.
-    This function NO LONGER prints to the screen. It just builds the layout.
+    A curses dashboard showing the joystick state.
+
+    Titles and labels are drawn once (and again by draw() after a resize
+    or screen clear). sync() only rewrites the value cells whose control
+    changed, so the output sent to the terminal grows with the number of
+    changes, not with the size of the dashboard.
     """
-    def create_table(data_dict, title):
-        table = Table(title=title, expand=True, show_header=False, border_style="dim")
-        table.add_column("Item", style="cyan", no_wrap=True)
-        table.add_column("Value", justify="right")
-        for item, value in data_dict.items():
-            if isinstance(value, int) and value in (0, 1):
-                state = "[bold green]Pressed[/]" if value else "[red]Off[/]"
-                table.add_row(item, state)
-            else:
-                color = "green" if value > 1000 else "red" if value < -1000 else "white"
-                table.add_row(item, f"[{color}]{value:+6d}[/]")
-        return Panel(table, title=f"[bold cyan]{title}[/]", border_style="cyan")
-
-    # --- Use the properties to create each panel ---
-    face_button_panel = create_table(joystick.face_buttons, "Face Buttons")
-    dpad_panel = create_table(joystick.dpad_state, "D-Pad")
-    shoulder_panel = create_table(joystick.shoulder_state, "Shoulders")
-    joystick_panel = create_table(joystick.joystick_state, "Joysticks")
-    back_button_panel = create_table(joystick.back_buttons, "Back Grips")
-    
-    left_column = Columns([face_button_panel, dpad_panel])
-    right_column = Columns([shoulder_panel, back_button_panel])
-    
-    return Columns([left_column, joystick_panel, right_column])
+
+    def __init__(self, stdscr, joystick):
+        """
+        Draws the dashboard layout for a joystick.
+
+        Args:
+            stdscr (curses.window): The screen to draw on (from curses.wrapper).
+            joystick (Joystick): The joystick whose group properties are shown.
+        """
+        self._stdscr = stdscr
+        self._joystick = joystick
+        self._init_colors()
+        self.draw()
+
+    def draw(self):
+        """Clears the screen and draws the whole layout with the current values."""
+        joystick = self._joystick
+
+        # (group bit, group dict, updater of each value cell, values currently shown)
+        self._groups = []
+
+        # clear() (not erase()) -> the next refresh repaints the whole terminal
+        self._stdscr.clear()
+        self._put(0, 0, "STEAM DECK INPUT DASHBOARD (Press Ctrl+C to quit)", curses.A_BOLD)
+
+        # Left column: face buttons + D-Pad, middle: joysticks, right: shoulders + back grips
+        y = self._draw_panel(joystick.face_buttons, "Face Buttons", GROUP_FACE_BUTTONS, 2, 0)
+        self._draw_panel(joystick.dpad_state, "D-Pad", GROUP_DPAD, y, 0)
+        self._draw_panel(joystick.joystick_state, "Joysticks", GROUP_JOYSTICKS, 2, PANEL_WIDTH,
+                         axis_labels=("LX", "LY", "RX", "RY"))
+        y = self._draw_panel(joystick.shoulder_state, "Shoulders", GROUP_SHOULDERS, 2, 2 * PANEL_WIDTH,
+                             axis_labels=("L2 Axis", "R2 Axis"))
+        self._draw_panel(joystick.back_buttons, "Back Grips", GROUP_BACK_BUTTONS, y, 2 * PANEL_WIDTH)
+
+    def _init_colors(self):
+        """Sets up the color attributes, falling back to plain text."""
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+
+        self._label = self._green = self._red = self._plain = curses.A_NORMAL
+        if curses.has_colors():
+            curses.start_color()
+            # Keep the terminal's own background if it supports that, else use black
+            try:
+                curses.use_default_colors()
+                background = -1
+            except curses.error:
+                background = curses.COLOR_BLACK
+            curses.init_pair(1, curses.COLOR_CYAN, background)
+            curses.init_pair(2, curses.COLOR_GREEN, background)
+            curses.init_pair(3, curses.COLOR_RED, background)
+            self._label = curses.color_pair(1)
+            self._green = curses.color_pair(2)
+            self._red = curses.color_pair(3)
+        self._title = self._label | curses.A_BOLD
+
+    def _put(self, y, x, text, attr=curses.A_NORMAL):
+        """Writes text at a screen position, ignoring text outside the window."""
+        try:
+            self._stdscr.addstr(y, x, text, attr)
+        except curses.error:
+            pass
+
+    def _make_cell_updater(self, y, x, is_axis):
+        """
+        Builds the function that redraws one value cell.
+
+        The position, colors and formatting of the cell are fixed here, so
+        the returned function only has to pick the text for the new value.
+
+        Args:
+            y (int): Screen row of the cell.
+            x (int): Screen column of the cell.
+            is_axis (bool): True for an analog axis, False for a button.
+
+        Returns:
+            callable: Takes the new value and writes it to the screen.
+        """
+        addstr = self._stdscr.addstr
+        error = curses.error
+
+        if is_axis:
+            green, red, plain = self._green, self._red, self._plain
+            format_axis = f"{{:+{VALUE_WIDTH}d}}".format
+
+            def update_axis(value):
+                attr = green if value > 1000 else red if value < -1000 else plain
+                try:
+                    addstr(y, x, format_axis(value), attr)
+                except error:
+                    pass
+            return update_axis
+
+        pressed = (f"{'Pressed':>{VALUE_WIDTH}}", self._green | curses.A_BOLD)
+        released = (f"{'Off':>{VALUE_WIDTH}}", self._red)
+
+        def update_button(value):
+            text, attr = pressed if value else released
+            try:
+                addstr(y, x, text, attr)
+            except error:
+                pass
+        return update_button
+
+    def _draw_panel(self, data_dict, title, group, y, x, axis_labels=()):
+        """
+        Draws one control group and registers its value cells.
+
+        Args:
+            data_dict (dict): The group's label -> value dict.
+            title (str): The panel title.
+            group (int): The group's GROUP_* bit.
+            y (int): Screen row of the title.
+            x (int): Screen column of the panel.
+            axis_labels (tuple): Labels of the analog axes in the group. All
+                other labels are shown as buttons.
+
+        Returns:
+            int: The first free row below the panel.
+        """
+        self._put(y, x, title, self._title)
+        updaters = []
+        for row, (item, value) in enumerate(data_dict.items(), start=y + 1):
+            self._put(row, x + 2, item, self._label)
+            is_axis = item in axis_labels
+            updater = self._make_cell_updater(row, x + PANEL_WIDTH - VALUE_WIDTH - 2, is_axis)
+            updater(value)
+            updaters.append(updater)
+
+        self._groups.append((group, data_dict, updaters, list(data_dict.values())))
+        return y + len(updaters) + 2
+
+    def sync(self, changed=-1):
+        """
+        Rewrites the cells whose value changed since the last sync.
+        Call refresh() on the screen afterwards to show them.
+
+        Args:
+            changed (int): GROUP_* mask from Joystick.state_changed(). Groups
+                not in the mask are skipped. Checks every group by default.
+
+        Returns:
+            bool: True if any cell was rewritten, False otherwise.
+        """
+        updated = False
+        for group, data_dict, updaters, shown in self._groups:
+            if not changed & group:
+                continue
+            for row, value in enumerate(data_dict.values()):
+                if value != shown[row]:
+                    shown[row] = value
+                    updaters[row](value)
+                    updated = True
+        return updated
+
+def run_dashboard(stdscr, joystick):
+    """
+    Shows the live dashboard until interrupted. Meant to be run by curses.wrapper.
+
+    Args:
+        stdscr (curses.window): The screen created by curses.wrapper.
+        joystick (Joystick): The joystick to read.
+    """
+    dashboard = Dashboard(stdscr, joystick)
+    stdscr.refresh()
+
+    # getch() must not block the frame loop; it is only used to spot resizes
+    stdscr.nodelay(True)
+    redraw_keys = (curses.KEY_RESIZE, ord("L") & 0x1f)  # terminal resized, Ctrl+L
+
+    # Time (SDL ticks, ms) at which the next frame is due
+    next_frame = sdl2.SDL_GetTicks() + REFRESH_DELAY_MS
+
+    # Main application loop
+    while True:
+        # 1. Update the joystick state as input arrives until the frame is due
+        joystick.update(max(0, next_frame - sdl2.SDL_GetTicks()))
+        if sdl2.SDL_GetTicks() < next_frame:
+            continue
+
+        # 2. Repaint everything after a resize or Ctrl+L, otherwise only
+        #    redraw the cells of the groups that changed (one terminal write per frame)
+        redraw = False
+        key = stdscr.getch()
+        while key != -1:
+            redraw = redraw or key in redraw_keys
+            key = stdscr.getch()
+
+        changed = joystick.state_changed()
+        if redraw:
+            dashboard.draw()
+            stdscr.refresh()
+        elif changed and dashboard.sync(changed):
+            stdscr.refresh()
+
+        # 3. Schedule the next frame, skipping ahead if we fell behind
+        now = sdl2.SDL_GetTicks()
+        next_frame += REFRESH_DELAY_MS
+        if next_frame < now:
+            next_frame = now + REFRESH_DELAY_MS
 
 def main():
     """Main execution function."""
@@ -292,17 +635,8 @@ def main():
         # Create an instance of our new Joystick class
         joystick = Joystick()
 
-        with Live(generate_dashboard_layout(joystick), screen=True, vertical_overflow="visible") as live:
-            # Main application loop
-            while True:
-                # 1. Update the joystick state by polling events
-                joystick.update()
-
-                # 2. Display the data using our modular functions
-                live.update(generate_dashboard_layout(joystick))
-
-                # 3. Wait a moment
-                sdl2.SDL_Delay(REFRESH_DELAY_SEC)
+        # curses.wrapper restores the terminal even if the loop raises
+        curses.wrapper(run_dashboard, joystick)
 
     except (RuntimeError, KeyboardInterrupt) as e:
         print(f"ERROR: {e}")
@@ -311,4 +645,4 @@ def main():
             joystick.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()